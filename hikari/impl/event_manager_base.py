@@ -60,7 +60,7 @@ if typing.TYPE_CHECKING:
     ]
     _ListenerMapT = typing.Dict[
         typing.Type[base_events.EventT],
-        typing.List[event_manager_.CallbackT[base_events.EventT]],
+        typing.Tuple[event_manager_.CallbackT[base_events.EventT], ...],
     ]
     _WaiterT = typing.Tuple[
         typing.Optional[event_manager_.PredicateT[base_events.EventT]], "asyncio.Future[base_events.EventT]"
@@ -205,10 +205,15 @@ class EventStream(event_manager_.EventStream[base_events.EventT]):
             if not self._event:
                 self._event = asyncio.Event()
 
-            try:
-                await asyncio.wait_for(self._event.wait(), timeout=self._timeout)
-            except asyncio.TimeoutError:
-                raise StopAsyncIteration from None
+            if self._timeout is None:
+                # Avoids the extra asyncio.wait_for coroutine frame when there is no timeout to apply.
+                await self._event.wait()
+
+            else:
+                try:
+                    await asyncio.wait_for(self._event.wait(), timeout=self._timeout)
+                except asyncio.TimeoutError:
+                    raise StopAsyncIteration from None
 
             self._event.clear()
 
@@ -354,6 +359,7 @@ class EventManagerBase(event_manager_.EventManager):
     """
 
     __slots__: typing.Sequence[str] = (
+        "_completed_future",
         "_consumers",
         "_event_factory",
         "_intents",
@@ -368,6 +374,7 @@ class EventManagerBase(event_manager_.EventManager):
         *,
         cache_components: config.CacheComponents = config.CacheComponents.NONE,
     ) -> None:
+        self._completed_future: typing.Optional[asyncio.Future[None]] = None
         self._consumers: typing.Dict[str, _Consumer] = {}
         self._event_factory = event_factory
         self._intents = intents
@@ -376,7 +383,8 @@ class EventManagerBase(event_manager_.EventManager):
 
         for name, member in inspect.getmembers(self):
             if name.startswith("on_"):
-                event_name = name[3:]
+                # Keyed by the upper-case name the gateway sends, so lookups rarely need to normalise it.
+                event_name = name[3:].upper()
                 if isinstance(member, _FilteredMethodT):
                     caching = (member.__cache_components__ & cache_components) != 0
 
@@ -440,8 +448,9 @@ class EventManagerBase(event_manager_.EventManager):
     ) -> None:
         if self._enabled_for_event(shard_events.ShardPayloadEvent):
             payload_event = self._event_factory.deserialize_shard_payload_event(shard, payload, name=event_name)
-            self.dispatch(payload_event)
-        consumer = self._consumers[event_name.lower()]
+            self._dispatch_nowait(payload_event)
+
+        consumer = self._consumers.get(event_name) or self._consumers[event_name.upper()]
         asyncio.create_task(self._handle_dispatch(consumer, shard, payload), name=f"dispatch {event_name}")
 
     # Yes, this is not generic. The reason for this is MyPy complains about
@@ -462,18 +471,21 @@ class EventManagerBase(event_manager_.EventManager):
         # warning is triggered.
         self._check_event(event_type, _nested)
 
-        _LOGGER.debug(
-            "subscribing callback 'async def %s%s' to event-type %s.%s",
-            getattr(callback, "__name__", "<anon>"),
-            inspect.signature(callback),
-            event_type.__module__,
-            event_type.__qualname__,
-        )
+        # inspect.signature is expensive, so only resolve it when it would actually be logged.
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "subscribing callback 'async def %s%s' to event-type %s.%s",
+                getattr(callback, "__name__", "<anon>"),
+                inspect.signature(callback),
+                event_type.__module__,
+                event_type.__qualname__,
+            )
 
-        try:
-            self._listeners[event_type].append(callback)
-        except KeyError:
-            self._listeners[event_type] = [callback]
+        # Listeners are stored as tuples, which are rebuilt here, to keep dispatching as cheap as possible.
+        if listeners := self._listeners.get(event_type):
+            self._listeners[event_type] = listeners + (callback,)
+        else:
+            self._listeners[event_type] = (callback,)
             self._increment_listener_group_count(event_type, 1)
 
     def get_listeners(
@@ -492,7 +504,7 @@ class EventManagerBase(event_manager_.EventManager):
             return listeners
 
         if items := self._listeners.get(event_type):
-            return items.copy()
+            return list(items)
 
         return []
 
@@ -506,15 +518,18 @@ class EventManagerBase(event_manager_.EventManager):
         callback: event_manager_.CallbackT[typing.Any],
     ) -> None:
         if listeners := self._listeners.get(event_type):
-            _LOGGER.debug(
-                "unsubscribing callback %s%s from event-type %s.%s",
-                getattr(callback, "__name__", "<anon>"),
-                inspect.signature(callback),
-                event_type.__module__,
-                event_type.__qualname__,
-            )
-            listeners.remove(callback)
-            if not listeners:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "unsubscribing callback %s%s from event-type %s.%s",
+                    getattr(callback, "__name__", "<anon>"),
+                    inspect.signature(callback),
+                    event_type.__module__,
+                    event_type.__qualname__,
+                )
+            index = listeners.index(callback)
+            if listeners := listeners[:index] + listeners[index + 1 :]:
+                self._listeners[event_type] = listeners
+            else:
                 del self._listeners[event_type]
                 self._increment_listener_group_count(event_type, -1)
 
@@ -555,36 +570,71 @@ class EventManagerBase(event_manager_.EventManager):
 
         return decorator
 
-    def dispatch(self, event: base_events.Event) -> asyncio.Future[typing.Any]:
+    def _prepare_dispatch(self, event: base_events.Event, /) -> typing.List[typing.Coroutine[None, typing.Any, None]]:
+        # Completes any matching waiters and returns the listener invocations that still need scheduling.
         tasks: typing.List[typing.Coroutine[None, typing.Any, None]] = []
+        # Bound once, rather than once per listener.
+        invoke_callback = self._invoke_callback
 
         for cls in event.dispatches():
             if listeners := self._listeners.get(cls):
                 for callback in listeners:
-                    tasks.append(self._invoke_callback(callback, event))
+                    tasks.append(invoke_callback(callback, event))
 
-            if cls not in self._waiters:
+            waiter_set = self._waiters.get(cls)
+            if waiter_set is None:
                 continue
 
-            waiter_set = self._waiters[cls]
-            for waiter in tuple(waiter_set):
+            # Completing a future only schedules its callbacks, so the set is iterated directly and finished
+            # waiters are removed in one go afterwards. Dispatching from within a predicate is not supported.
+            finished_waiters: typing.List[_WaiterT[base_events.Event]] = []
+            for waiter in waiter_set:
                 predicate, future = waiter
-                if not future.done():
+                # Cancelled or timed out waiters are just dropped without calling their predicate.
+                if future.done():
+                    pass
+
+                elif predicate is None:
+                    future.set_result(event)
+
+                else:
                     try:
-                        if predicate and not predicate(event):
+                        if not predicate(event):
                             continue
                     except Exception as ex:
                         future.set_exception(ex)
                     else:
                         future.set_result(event)
 
-                waiter_set.remove(waiter)
+                finished_waiters.append(waiter)
 
+            waiter_set.difference_update(finished_waiters)
             if not waiter_set:
                 del self._waiters[cls]
                 self._increment_waiter_group_count(cls, -1)
 
-        return asyncio.gather(*tasks) if tasks else aio.completed_future()
+        return tasks
+
+    def _dispatch_nowait(self, event: base_events.Event, /) -> None:
+        # For internal callers which never await the result, so there is no need to gather the listeners.
+        create_task = asyncio.create_task
+        for task in self._prepare_dispatch(event):
+            create_task(task)
+
+    def dispatch(self, event: base_events.Event) -> asyncio.Future[typing.Any]:
+        tasks = self._prepare_dispatch(event)
+
+        if not tasks:
+            # Most events have nobody listening, so share one completed future rather than making a new one each time.
+            # A completed future cannot be changed by whoever receives it, but it is bound to the loop it was made on.
+            # This keeps the last loop alive until the next listener-less dispatch runs on a different one.
+            future = self._completed_future
+            if future is None or future.get_loop() is not asyncio.get_running_loop():
+                future = self._completed_future = aio.completed_future()
+
+            return future
+
+        return asyncio.gather(*tasks)
 
     def stream(
         self,
@@ -622,14 +672,18 @@ class EventManagerBase(event_manager_.EventManager):
 
         waiter_set.add(pair)  # type: ignore[arg-type]
         try:
-            return await asyncio.wait_for(future, timeout=timeout)
-        except asyncio.TimeoutError:
-            waiter_set.remove(pair)  # type: ignore[arg-type]
-            if not waiter_set:
-                del self._waiters[event_type]
-                self._increment_waiter_group_count(event_type, -1)
+            if timeout is None:
+                # Cancelling the awaiting task cancels the future as well, so nothing needs wrapping.
+                return await future
 
-            raise
+            return await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            # Waiters completed by dispatch are already removed, anything left timed out or got cancelled.
+            if pair in waiter_set:
+                waiter_set.remove(pair)  # type: ignore[arg-type]
+                if not waiter_set:
+                    del self._waiters[event_type]
+                    self._increment_waiter_group_count(event_type, -1)
 
     async def _handle_dispatch(
         self,
@@ -23,6 +23,7 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import inspect
 import logging
 import sys
 import typing
@@ -180,10 +181,11 @@ class TestEventStream:
                 await streamer.next()
 
     @pytest.mark.asyncio()
+    @pytest.mark.parametrize("timeout", [None, 100])
     @hikari_test_helpers.timeout()
-    async def test___anext___waits_for_next_event(self):
+    async def test___anext___waits_for_next_event(self, timeout):
         mock_event = object()
-        streamer = event_manager_base.EventStream(mock.Mock(), event_type=base_events.Event, timeout=None)
+        streamer = event_manager_base.EventStream(mock.Mock(), event_type=base_events.Event, timeout=timeout)
 
         async def quickly_run_task(task):
             try:
@@ -440,10 +442,10 @@ class TestEventManagerBase:
             mock.Mock(), 0, cache_components=config.CacheComponents.MEMBERS | config.CacheComponents.GUILD_CHANNELS
         )
         assert manager._consumers == {
-            "foo": event_manager_base._Consumer(manager.on_foo, 9, True),
-            "bar": event_manager_base._Consumer(manager.on_bar, 105, False),
-            "bat": event_manager_base._Consumer(manager.on_bat, 65545, False),
-            "not_decorated": event_manager_base._Consumer(manager.on_not_decorated, -1, True),
+            "FOO": event_manager_base._Consumer(manager.on_foo, 9, True),
+            "BAR": event_manager_base._Consumer(manager.on_bar, 105, False),
+            "BAT": event_manager_base._Consumer(manager.on_bat, 65545, False),
+            "NOT_DECORATED": event_manager_base._Consumer(manager.on_not_decorated, -1, True),
         }
 
     def test___init___loads_consumers_when_cacheless(self):
@@ -468,10 +470,10 @@ class TestEventManagerBase:
 
         manager = StubManager(mock.Mock(), 0, cache_components=config.CacheComponents.NONE)
         assert manager._consumers == {
-            "foo": event_manager_base._Consumer(manager.on_foo, 9, False),
-            "bar": event_manager_base._Consumer(manager.on_bar, 105, False),
-            "bat": event_manager_base._Consumer(manager.on_bat, 65545, False),
-            "not_decorated": event_manager_base._Consumer(manager.on_not_decorated, -1, False),
+            "FOO": event_manager_base._Consumer(manager.on_foo, 9, False),
+            "BAR": event_manager_base._Consumer(manager.on_bar, 105, False),
+            "BAT": event_manager_base._Consumer(manager.on_bat, 65545, False),
+            "NOT_DECORATED": event_manager_base._Consumer(manager.on_not_decorated, -1, False),
         }
 
     def test__increment_listener_group_count(self, event_manager):
@@ -522,13 +524,13 @@ class TestEventManagerBase:
         mock_payload = {"id": "3123123123"}
         mock_shard = mock.Mock(id=123)
         event_manager._handle_dispatch = mock.Mock()
-        event_manager.dispatch = mock.Mock()
+        event_manager._dispatch_nowait = mock.Mock()
 
         with pytest.raises(LookupError):
             event_manager.consume_raw_event("UNEXISTING_EVENT", mock_shard, mock_payload)
 
         event_manager._handle_dispatch.assert_not_called()
-        event_manager.dispatch.assert_called_once_with(
+        event_manager._dispatch_nowait.assert_called_once_with(
             event_manager._event_factory.deserialize_shard_payload_event.return_value
         )
         event_manager._event_factory.deserialize_shard_payload_event.assert_called_once_with(
@@ -540,9 +542,9 @@ class TestEventManagerBase:
     async def test_consume_raw_event_when_found(self, event_manager):
         event_manager._enabled_for_event = mock.Mock(return_value=True)
         event_manager._handle_dispatch = mock.Mock()
-        event_manager.dispatch = mock.Mock()
+        event_manager._dispatch_nowait = mock.Mock()
         on_existing_event = object()
-        event_manager._consumers = {"existing_event": on_existing_event}
+        event_manager._consumers = {"EXISTING_EVENT": on_existing_event}
         shard = object()
         payload = {"berp": "baz"}
 
@@ -554,7 +556,7 @@ class TestEventManagerBase:
             event_manager._handle_dispatch(on_existing_event, shard, {"berp": "baz"}),
             name="dispatch EXISTING_EVENT",
         )
-        event_manager.dispatch.assert_called_once_with(
+        event_manager._dispatch_nowait.assert_called_once_with(
             event_manager._event_factory.deserialize_shard_payload_event.return_value
         )
         event_manager._event_factory.deserialize_shard_payload_event.assert_called_once_with(
@@ -562,13 +564,31 @@ class TestEventManagerBase:
         )
         event_manager._enabled_for_event.assert_called_once_with(shard_events.ShardPayloadEvent)
 
+    @pytest.mark.asyncio()
+    async def test_consume_raw_event_when_name_not_upper_case(self, event_manager):
+        event_manager._enabled_for_event = mock.Mock(return_value=False)
+        event_manager._handle_dispatch = mock.Mock()
+        on_existing_event = object()
+        event_manager._consumers = {"EXISTING_EVENT": on_existing_event}
+        shard = object()
+        payload = {"berp": "baz"}
+
+        with mock.patch("asyncio.create_task") as create_task:
+            event_manager.consume_raw_event("existing_event", shard, payload)
+
+        event_manager._handle_dispatch.assert_called_once_with(on_existing_event, shard, {"berp": "baz"})
+        create_task.assert_called_once_with(
+            event_manager._handle_dispatch(on_existing_event, shard, {"berp": "baz"}),
+            name="dispatch existing_event",
+        )
+
     @pytest.mark.asyncio()
     async def test_consume_raw_event_skips_raw_dispatch_when_not_enabled(self, event_manager):
         event_manager._enabled_for_event = mock.Mock(return_value=False)
         event_manager._handle_dispatch = mock.Mock()
-        event_manager.dispatch = mock.Mock()
+        event_manager._dispatch_nowait = mock.Mock()
         on_existing_event = object()
-        event_manager._consumers = {"existing_event": on_existing_event}
+        event_manager._consumers = {"EXISTING_EVENT": on_existing_event}
         shard = object()
         payload = {"berp": "baz"}
 
@@ -580,7 +600,7 @@ class TestEventManagerBase:
             event_manager._handle_dispatch(on_existing_event, shard, {"berp": "baz"}),
             name="dispatch EXISTING_EVENT",
         )
-        event_manager.dispatch.assert_not_called()
+        event_manager._dispatch_nowait.assert_not_called()
         event_manager._event_factory.deserialize_shard_payload_event.vassert_not_called()
         event_manager._enabled_for_event.assert_called_once_with(shard_events.ShardPayloadEvent)
 
@@ -662,7 +682,7 @@ class TestEventManagerBase:
 
         event_manager.subscribe(member_events.MemberCreateEvent, test, _nested=1)
 
-        assert event_manager._listeners == {member_events.MemberCreateEvent: [test]}
+        assert event_manager._listeners == {member_events.MemberCreateEvent: (test,)}
         event_manager._check_event.assert_called_once_with(member_events.MemberCreateEvent, 1)
         event_manager._increment_listener_group_count.assert_called_once_with(member_events.MemberCreateEvent, 1)
 
@@ -674,15 +694,32 @@ class TestEventManagerBase:
             ...
 
         event_manager._increment_listener_group_count = mock.Mock()
-        event_manager._listeners[member_events.MemberCreateEvent] = [test2]
+        event_manager._listeners[member_events.MemberCreateEvent] = (test2,)
         event_manager._check_event = mock.Mock()
 
         event_manager.subscribe(member_events.MemberCreateEvent, test, _nested=2)
 
-        assert event_manager._listeners == {member_events.MemberCreateEvent: [test2, test]}
+        assert event_manager._listeners == {member_events.MemberCreateEvent: (test2, test)}
         event_manager._check_event.assert_called_once_with(member_events.MemberCreateEvent, 2)
         event_manager._increment_listener_group_count.assert_not_called()
 
+    def test_subscribe_does_not_resolve_signature_when_not_debug_logging(self, event_manager):
+        async def test():
+            ...
+
+        event_manager._check_event = mock.Mock()
+
+        with mock.patch.object(event_manager_base, "_LOGGER") as logger:
+            with mock.patch.object(inspect, "signature") as signature:
+                logger.isEnabledFor.return_value = False
+
+                event_manager.subscribe(member_events.MemberCreateEvent, test)
+
+        logger.isEnabledFor.assert_called_once_with(logging.DEBUG)
+        logger.debug.assert_not_called()
+        signature.assert_not_called()
+        assert event_manager._listeners == {member_events.MemberCreateEvent: (test,)}
+
     @pytest.mark.parametrize("obj", ["test", event_manager_base.EventManagerBase])
     def test__check_event_when_event_type_does_not_subclass_Event(self, event_manager, obj):
         with pytest.raises(TypeError, match=r"'event_type' is a non-Event type"):
@@ -734,30 +771,30 @@ class TestEventManagerBase:
 
     def test_get_listeners_polymorphic(self, event_manager):
         event_manager._listeners = {
-            base_events.Event: ["coroutine0"],
-            member_events.MemberEvent: ["coroutine1"],
-            member_events.MemberCreateEvent: ["hi", "i am"],
-            member_events.MemberUpdateEvent: ["hidden"],
-            base_events.ExceptionEvent: ["so you won't see me"],
+            base_events.Event: ("coroutine0",),
+            member_events.MemberEvent: ("coroutine1",),
+            member_events.MemberCreateEvent: ("hi", "i am"),
+            member_events.MemberUpdateEvent: ("hidden",),
+            base_events.ExceptionEvent: ("so you won't see me",),
         }
 
         assert event_manager.get_listeners(member_events.MemberEvent) == ["coroutine1", "coroutine0"]
 
     def test_get_listeners_monomorphic_and_no_results(self, event_manager):
         event_manager._listeners = {
-            member_events.MemberCreateEvent: ["coroutine1", "coroutine2"],
-            member_events.MemberUpdateEvent: ["coroutine3"],
-            member_events.MemberDeleteEvent: ["coroutine4", "coroutine5"],
+            member_events.MemberCreateEvent: ("coroutine1", "coroutine2"),
+            member_events.MemberUpdateEvent: ("coroutine3",),
+            member_events.MemberDeleteEvent: ("coroutine4", "coroutine5"),
         }
 
         assert event_manager.get_listeners(member_events.MemberEvent, polymorphic=False) == []
 
     def test_get_listeners_monomorphic_and_results(self, event_manager):
         event_manager._listeners = {
-            member_events.MemberEvent: ["coroutine0"],
-            member_events.MemberCreateEvent: ["coroutine1", "coroutine2"],
-            member_events.MemberUpdateEvent: ["coroutine3"],
-            member_events.MemberDeleteEvent: ["coroutine4", "coroutine5"],
+            member_events.MemberEvent: ("coroutine0",),
+            member_events.MemberCreateEvent: ("coroutine1", "coroutine2"),
+            member_events.MemberUpdateEvent: ("coroutine3",),
+            member_events.MemberDeleteEvent: ("coroutine4", "coroutine5"),
         }
 
         assert event_manager.get_listeners(member_events.MemberEvent, polymorphic=False) == ["coroutine0"]
@@ -783,15 +820,15 @@ class TestEventManagerBase:
 
         event_manager._increment_listener_group_count = mock.Mock()
         event_manager._listeners = {
-            member_events.MemberCreateEvent: [test, test2],
-            member_events.MemberDeleteEvent: [test],
+            member_events.MemberCreateEvent: (test, test2),
+            member_events.MemberDeleteEvent: (test,),
         }
 
         event_manager.unsubscribe(member_events.MemberCreateEvent, test)
 
         assert event_manager._listeners == {
-            member_events.MemberCreateEvent: [test2],
-            member_events.MemberDeleteEvent: [test],
+            member_events.MemberCreateEvent: (test2,),
+            member_events.MemberDeleteEvent: (test,),
         }
         event_manager._increment_listener_group_count.assert_not_called()
 
@@ -800,13 +837,29 @@ class TestEventManagerBase:
             ...
 
         event_manager._increment_listener_group_count = mock.Mock()
-        event_manager._listeners = {member_events.MemberCreateEvent: [test], member_events.MemberDeleteEvent: [test]}
+        event_manager._listeners = {member_events.MemberCreateEvent: (test,), member_events.MemberDeleteEvent: (test,)}
 
         event_manager.unsubscribe(member_events.MemberCreateEvent, test)
 
-        assert event_manager._listeners == {member_events.MemberDeleteEvent: [test]}
+        assert event_manager._listeners == {member_events.MemberDeleteEvent: (test,)}
         event_manager._increment_listener_group_count.assert_called_once_with(member_events.MemberCreateEvent, -1)
 
+    def test_unsubscribe_when_callback_not_in_listeners(self, event_manager):
+        async def test():
+            ...
+
+        async def test2():
+            ...
+
+        event_manager._increment_listener_group_count = mock.Mock()
+        event_manager._listeners = {member_events.MemberCreateEvent: (test2,)}
+
+        with pytest.raises(ValueError):
+            event_manager.unsubscribe(member_events.MemberCreateEvent, test)
+
+        assert event_manager._listeners == {member_events.MemberCreateEvent: (test2,)}
+        event_manager._increment_listener_group_count.assert_not_called()
+
     def test_listen_when_no_params(self, event_manager):
         with pytest.raises(TypeError):
 
@@ -917,3 +970,189 @@ class TestEventManagerBase:
             @event_manager.listen()
             async def test(event: list[member_events.MemberUpdateEvent]):
                 ...
+
+    @pytest.mark.asyncio()
+    async def test_dispatch_when_no_listeners(self, event_manager):
+        event = mock.Mock(dispatches=mock.Mock(return_value=(member_events.MemberCreateEvent,)))
+
+        with mock.patch.object(asyncio, "gather") as gather:
+            future = event_manager.dispatch(event)
+
+        assert future.done()
+        assert future.result() is None
+        gather.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_dispatch_when_no_listeners_reuses_completed_future(self, event_manager):
+        event = mock.Mock(dispatches=mock.Mock(return_value=(member_events.MemberCreateEvent,)))
+
+        assert event_manager.dispatch(event) is event_manager.dispatch(event)
+
+    @pytest.mark.asyncio()
+    async def test_dispatch_when_no_listeners_and_completed_future_from_other_loop(self, event_manager):
+        event = mock.Mock(dispatches=mock.Mock(return_value=(member_events.MemberCreateEvent,)))
+        other_loop = asyncio.new_event_loop()
+        try:
+            event_manager._completed_future = other_loop.create_future()
+
+            future = event_manager.dispatch(event)
+        finally:
+            other_loop.close()
+
+        assert future.get_loop() is asyncio.get_running_loop()
+        assert future.result() is None
+        assert event_manager._completed_future is future
+
+    @pytest.mark.asyncio()
+    async def test_dispatch_when_single_listener(self, event_manager):
+        event = mock.Mock(dispatches=mock.Mock(return_value=(member_events.MemberCreateEvent,)))
+        callback = mock.AsyncMock()
+        event_manager._listeners = {member_events.MemberCreateEvent: (callback,)}
+
+        assert await event_manager.dispatch(event) == [None]
+
+        callback.assert_awaited_once_with(event)
+
+    @pytest.mark.asyncio()
+    async def test_dispatch_when_multiple_listeners(self, event_manager):
+        event = mock.Mock(
+            dispatches=mock.Mock(return_value=(member_events.MemberCreateEvent, member_events.MemberEvent))
+        )
+        callback_1 = mock.AsyncMock()
+        callback_2 = mock.AsyncMock()
+        event_manager._listeners = {
+            member_events.MemberCreateEvent: (callback_1,),
+            member_events.MemberEvent: (callback_2,),
+        }
+
+        assert await event_manager.dispatch(event) == [None, None]
+
+        callback_1.assert_awaited_once_with(event)
+        callback_2.assert_awaited_once_with(event)
+
+    @pytest.mark.asyncio()
+    async def test_dispatch_completes_waiters(self, event_manager, event_loop):
+        event = mock.Mock(dispatches=mock.Mock(return_value=(member_events.MemberCreateEvent,)))
+        error = RuntimeError("blep")
+        matched_future = event_loop.create_future()
+        unmatched_future = event_loop.create_future()
+        errored_future = event_loop.create_future()
+        cancelled_future = event_loop.create_future()
+        cancelled_future.cancel()
+        cancelled_predicate = mock.Mock()
+        unmatched_waiter = (mock.Mock(return_value=False), unmatched_future)
+        event_manager._increment_waiter_group_count = mock.Mock()
+        event_manager._waiters = {
+            member_events.MemberCreateEvent: {
+                (None, matched_future),
+                unmatched_waiter,
+                (mock.Mock(side_effect=error), errored_future),
+                (cancelled_predicate, cancelled_future),
+            }
+        }
+
+        await event_manager.dispatch(event)
+
+        assert matched_future.result() is event
+        assert not unmatched_future.done()
+        assert errored_future.exception() is error
+        cancelled_predicate.assert_not_called()
+        assert event_manager._waiters == {member_events.MemberCreateEvent: {unmatched_waiter}}
+        event_manager._increment_waiter_group_count.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test_dispatch_removes_empty_waiter_set(self, event_manager, event_loop):
+        event = mock.Mock(dispatches=mock.Mock(return_value=(member_events.MemberCreateEvent,)))
+        future = event_loop.create_future()
+        event_manager._increment_waiter_group_count = mock.Mock()
+        event_manager._waiters = {member_events.MemberCreateEvent: {(None, future)}}
+
+        await event_manager.dispatch(event)
+
+        assert future.result() is event
+        assert event_manager._waiters == {}
+        event_manager._increment_waiter_group_count.assert_called_once_with(member_events.MemberCreateEvent, -1)
+
+    @pytest.mark.asyncio()
+    async def test_wait_for(self, event_manager):
+        event = mock.Mock(dispatches=mock.Mock(return_value=(member_events.MemberCreateEvent,)))
+        event_manager._check_event = mock.Mock()
+        event_manager._increment_waiter_group_count = mock.Mock()
+
+        task = asyncio.create_task(event_manager.wait_for(member_events.MemberCreateEvent, timeout=None))
+        await asyncio.sleep(0)
+        event_manager.dispatch(event)
+
+        assert await task is event
+        assert event_manager._waiters == {}
+        event_manager._check_event.assert_called_once_with(member_events.MemberCreateEvent, 1)
+        event_manager._increment_waiter_group_count.assert_has_calls(
+            [mock.call(member_events.MemberCreateEvent, 1), mock.call(member_events.MemberCreateEvent, -1)]
+        )
+
+    @pytest.mark.asyncio()
+    async def test_wait_for_when_timed_out(self, event_manager):
+        event_manager._check_event = mock.Mock()
+        event_manager._increment_waiter_group_count = mock.Mock()
+
+        with pytest.raises(asyncio.TimeoutError):
+            await event_manager.wait_for(member_events.MemberCreateEvent, timeout=0.001)
+
+        assert event_manager._waiters == {}
+        event_manager._increment_waiter_group_count.assert_has_calls(
+            [mock.call(member_events.MemberCreateEvent, 1), mock.call(member_events.MemberCreateEvent, -1)]
+        )
+
+    @pytest.mark.asyncio()
+    async def test_wait_for_when_cancelled(self, event_manager):
+        event_manager._check_event = mock.Mock()
+        event_manager._increment_waiter_group_count = mock.Mock()
+
+        task = asyncio.create_task(event_manager.wait_for(member_events.MemberCreateEvent, timeout=None))
+        await asyncio.sleep(0)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert event_manager._waiters == {}
+        event_manager._increment_waiter_group_count.assert_has_calls(
+            [mock.call(member_events.MemberCreateEvent, 1), mock.call(member_events.MemberCreateEvent, -1)]
+        )
+
+    @pytest.mark.asyncio()
+    async def test_wait_for_keeps_other_waiters_when_cancelled(self, event_manager, event_loop):
+        other_waiter = (None, event_loop.create_future())
+        event_manager._check_event = mock.Mock()
+        event_manager._increment_waiter_group_count = mock.Mock()
+        event_manager._waiters = {member_events.MemberCreateEvent: {other_waiter}}
+
+        task = asyncio.create_task(event_manager.wait_for(member_events.MemberCreateEvent, timeout=None))
+        await asyncio.sleep(0)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert event_manager._waiters == {member_events.MemberCreateEvent: {other_waiter}}
+        event_manager._increment_waiter_group_count.assert_not_called()
+
+    @pytest.mark.asyncio()
+    async def test__dispatch_nowait(self, event_manager):
+        event = mock.Mock(
+            dispatches=mock.Mock(return_value=(member_events.MemberCreateEvent, member_events.MemberEvent))
+        )
+        callback_1 = mock.AsyncMock()
+        callback_2 = mock.AsyncMock()
+        event_manager._listeners = {
+            member_events.MemberCreateEvent: (callback_1,),
+            member_events.MemberEvent: (callback_2,),
+        }
+
+        with mock.patch.object(asyncio, "gather") as gather:
+            assert event_manager._dispatch_nowait(event) is None
+
+        await asyncio.sleep(0)
+        callback_1.assert_awaited_once_with(event)
+        callback_2.assert_awaited_once_with(event)
+        gather.assert_not_called()